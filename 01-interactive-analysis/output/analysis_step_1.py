@@ -13,10 +13,10 @@ Output:
 - phase1_results.md
 """
 
+import hashlib
+import pickle
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from scipy import stats
 from pathlib import Path
 from datetime import datetime
@@ -24,13 +24,17 @@ from datetime import datetime
 # =============================================================================
 # SETUP
 # =============================================================================
-plt.style.use('seaborn-v0_8-whitegrid')
 PROJECT_ROOT = Path(__file__).parent.parent
-DATA_PATH = PROJECT_ROOT / "data" / "fred" / "consumer_credit_risk_data.csv"
+DATA_PATH = PROJECT_ROOT / "data" / "fred" / "consumer_credit_risk_data.parquet"
 OUTPUT_DIR = PROJECT_ROOT / "output"
-
-# Load data
-df = pd.read_csv(DATA_PATH, parse_dates=['date'])
+CACHE_DIR = OUTPUT_DIR / ".phase1_cache"
+
+# Load data (fall back to the CSV copy if the Parquet file has not been fetched)
+DATA_FILE = DATA_PATH if DATA_PATH.exists() else DATA_PATH.with_suffix('.csv')
+if DATA_FILE.suffix == '.parquet':
+    df = pd.read_parquet(DATA_FILE)
+else:
+    df = pd.read_csv(DATA_FILE, parse_dates=['date'])
 df.set_index('date', inplace=True)
 
 # Configuration
@@ -62,24 +66,49 @@ print(f"Data: {df.index.min():%Y-%m-%d} to {df.index.max():%Y-%m-%d} ({len(df)}
 # =============================================================================
 print("\n[1/4] Calculating lagged correlations (0-12 months)...")
 
-lag_correlations = {}
-p_values = {}
-
-for predictor in PREDICTORS:
-    corrs, pvals = [], []
-    for lag in LAG_RANGE:
-        if lag == 0:
-            valid = df[[predictor, TARGET]].dropna()
-            r, p = stats.pearsonr(valid[predictor], valid[TARGET])
-        else:
-            shifted = df[predictor].shift(lag)
-            valid = pd.DataFrame({'x': shifted, 'y': df[TARGET]}).dropna()
-            r, p = stats.pearsonr(valid['x'], valid['y'])
-        corrs.append(r)
-        pvals.append(p)
-    lag_correlations[predictor] = corrs
-    p_values[predictor] = pvals
-    print(f"   {PREDICTOR_INFO[predictor]['name']}: done")
+# Correlations and p-values only depend on the input data and the lag setup, so
+# they are memoized on disk under a hash of both; labels and the significance
+# threshold are applied fresh every run in step 2
+data_hash = hashlib.sha256(DATA_FILE.read_bytes())
+data_hash.update(repr(('lag_correlations, p_values', TARGET, PREDICTORS, list(LAG_RANGE))).encode())
+cache_path = CACHE_DIR / f"{data_hash.hexdigest()[:16]}.pkl"
+
+if cache_path.exists():
+    with open(cache_path, 'rb') as f:
+        lag_correlations, p_values = pickle.load(f)
+    print(f"   Loaded from cache: {cache_path.name}")
+else:
+    lag_correlations = {}
+    lag_counts = {}
+
+    # Lags are slice views over the raw arrays (predictor leads target by `lag`),
+    # so r comes from centred dot products without building shifted frames
+    y = df[TARGET].to_numpy(dtype=np.float64)
+
+    for predictor in PREDICTORS:
+        x = df[predictor].to_numpy(dtype=np.float64)
+        corrs, counts = [], []
+        for lag in LAG_RANGE:
+            xs, ys = x[:len(x) - lag], y[lag:]
+            valid = ~np.isnan(xs) & ~np.isnan(ys)
+            dx = xs[valid] - xs[valid].mean()
+            dy = ys[valid] - ys[valid].mean()
+            corrs.append(float(dx @ dy / np.sqrt((dx @ dx) * (dy @ dy))))
+            counts.append(int(valid.sum()))
+        lag_correlations[predictor] = corrs
+        lag_counts[predictor] = counts
+        print(f"   {PREDICTOR_INFO[predictor]['name']}: done")
+
+    # Two-sided p-values for every predictor/lag in one t-distribution call,
+    # using each lag's valid observation count
+    r = np.array([lag_correlations[p] for p in PREDICTORS])
+    n = np.array([lag_counts[p] for p in PREDICTORS])
+    t = r * np.sqrt((n - 2) / (1 - r**2))
+    p_values = dict(zip(PREDICTORS, (2 * stats.t.sf(np.abs(t), n - 2)).tolist()))
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'wb') as f:
+        pickle.dump((lag_correlations, p_values), f)
 
 corr_df = pd.DataFrame(lag_correlations, index=list(LAG_RANGE))
 
@@ -90,8 +119,7 @@ print("\n[2/4] Identifying optimal lags...")
 
 results = {}
 for predictor in PREDICTORS:
-    abs_corrs = [abs(c) for c in lag_correlations[predictor]]
-    opt_lag = abs_corrs.index(max(abs_corrs))
+    opt_lag = int(np.argmax(np.abs(lag_correlations[predictor])))
     opt_corr = lag_correlations[predictor][opt_lag]
     opt_pval = p_values[predictor][opt_lag]
 
@@ -115,44 +143,65 @@ print(f"   Strongest predictor: {results[strongest]['name']}")
 # =============================================================================
 print("\n[3/4] Creating correlation heatmap...")
 
-fig, axes = plt.subplots(1, 2, figsize=(16, 6))
-
-# Left: Heatmap
-ax1 = axes[0]
-heatmap_data = corr_df.T.rename(index={p: PREDICTOR_INFO[p]['name'] for p in PREDICTORS})
-sns.heatmap(heatmap_data, annot=True, fmt='.2f', cmap='RdYlGn_r', center=0,
-            ax=ax1, vmin=-1, vmax=1, linewidths=0.5,
-            cbar_kws={'label': 'Correlation Coefficient'})
-ax1.set_title('Lagged Correlations with Delinquency Rate\n(Predictor leads by N months)',
-              fontsize=13, fontweight='bold', pad=15)
-ax1.set_xlabel('Lag (months)', fontsize=11)
-ax1.set_ylabel('Predictor', fontsize=11)
-
-# Right: Line plot
-ax2 = axes[1]
-colors = {'UNRATE': '#3498db', 'FEDFUNDS': '#e67e22', 'TOTALSL': '#27ae60'}
-
-for pred in PREDICTORS:
-    ax2.plot(LAG_RANGE, lag_correlations[pred], 'o-', color=colors[pred],
-             label=PREDICTOR_INFO[pred]['name'], linewidth=2, markersize=6)
-    # Mark optimal point
-    opt = results[pred]
-    ax2.scatter([opt['optimal_lag']], [opt['correlation']],
-                color=colors[pred], s=180, zorder=5, edgecolor='black', linewidth=2)
-
-ax2.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
-ax2.set_xlabel('Lag (months)', fontsize=11)
-ax2.set_ylabel('Correlation with Delinquency Rate', fontsize=11)
-ax2.set_title('Correlation Strength by Lag Period\n(Large markers = optimal lag)',
-              fontsize=13, fontweight='bold', pad=15)
-ax2.legend(loc='best', fontsize=10)
-ax2.grid(True, alpha=0.3)
-ax2.set_xticks(list(LAG_RANGE))
-ax2.set_ylim(-1, 1)
-
-plt.tight_layout()
-plt.savefig(OUTPUT_DIR / 'correlation_analysis.png', dpi=150, bbox_inches='tight')
-print(f"   Saved: correlation_analysis.png")
+def make_plot(path):
+    """Render the heatmap and lag chart; plotting libraries are only imported here."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    plt.style.use('seaborn-v0_8-whitegrid')
+
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+
+    # Left: Heatmap
+    ax1 = axes[0]
+    heatmap_data = corr_df.T.rename(index={p: PREDICTOR_INFO[p]['name'] for p in PREDICTORS})
+    sns.heatmap(heatmap_data, annot=True, fmt='.2f', cmap='RdYlGn_r', center=0,
+                ax=ax1, vmin=-1, vmax=1, linewidths=0.5,
+                cbar_kws={'label': 'Correlation Coefficient'})
+    ax1.set_title('Lagged Correlations with Delinquency Rate\n(Predictor leads by N months)',
+                  fontsize=13, fontweight='bold', pad=15)
+    ax1.set_xlabel('Lag (months)', fontsize=11)
+    ax1.set_ylabel('Predictor', fontsize=11)
+
+    # Right: Line plot
+    ax2 = axes[1]
+    colors = {'UNRATE': '#3498db', 'FEDFUNDS': '#e67e22', 'TOTALSL': '#27ae60'}
+
+    for pred in PREDICTORS:
+        ax2.plot(LAG_RANGE, lag_correlations[pred], 'o-', color=colors[pred],
+                 label=PREDICTOR_INFO[pred]['name'], linewidth=2, markersize=6)
+        # Mark optimal point
+        opt = results[pred]
+        ax2.scatter([opt['optimal_lag']], [opt['correlation']],
+                    color=colors[pred], s=180, zorder=5, edgecolor='black', linewidth=2)
+
+    ax2.axhline(y=0, color='gray', linestyle='--', alpha=0.5)
+    ax2.set_xlabel('Lag (months)', fontsize=11)
+    ax2.set_ylabel('Correlation with Delinquency Rate', fontsize=11)
+    ax2.set_title('Correlation Strength by Lag Period\n(Large markers = optimal lag)',
+                  fontsize=13, fontweight='bold', pad=15)
+    ax2.legend(loc='best', fontsize=10)
+    ax2.grid(True, alpha=0.3)
+    ax2.set_xticks(list(LAG_RANGE))
+    ax2.set_ylim(-1, 1)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=150, bbox_inches='tight')
+
+
+# The figure only depends on the cached correlations and the predictor labels, so
+# it is reused while a stamp of both matches
+plot_path = OUTPUT_DIR / 'correlation_analysis.png'
+plot_stamp = CACHE_DIR / 'correlation_analysis.key'
+plot_key = hashlib.sha256(
+    repr((cache_path.name, {p: PREDICTOR_INFO[p]['name'] for p in PREDICTORS})).encode()
+).hexdigest()[:16]
+if plot_path.exists() and plot_stamp.exists() and plot_stamp.read_text() == plot_key:
+    print(f"   Up to date: correlation_analysis.png")
+else:
+    make_plot(plot_path)
+    plot_stamp.write_text(plot_key)
+    print(f"   Saved: correlation_analysis.png")
 
 # =============================================================================
 # STEP 4: GENERATE MARKDOWN REPORT
@@ -160,19 +209,18 @@ print(f"   Saved: correlation_analysis.png")
 print("\n[4/4] Generating markdown report...")
 
 # Build tables
-corr_matrix_md = "| Lag | " + " | ".join([PREDICTOR_INFO[p]['name'] for p in PREDICTORS]) + " |\n"
-corr_matrix_md += "|:---:|" + "|".join(["---:" for _ in PREDICTORS]) + "|\n"
-for lag in LAG_RANGE:
-    row = f"| {lag} |"
-    for p in PREDICTORS:
-        row += f" {lag_correlations[p][lag]:+.3f} |"
-    corr_matrix_md += row + "\n"
-
-optimal_table_md = "| Rank | Indicator | Optimal Lag | Correlation | p-value | Significant |\n"
-optimal_table_md += "|:----:|-----------|:-----------:|:-----------:|:-------:|:-----------:|\n"
-for i, (pred, data) in enumerate(ranked, 1):
-    sig = "Yes" if data['significant'] else "No"
-    optimal_table_md += f"| {i} | {data['name']} | {data['optimal_lag']} months | {data['correlation']:+.3f} | {data['p_value']:.2e} | {sig} |\n"
+corr_matrix_md = "\n".join([
+    "| Lag | " + " | ".join([PREDICTOR_INFO[p]['name'] for p in PREDICTORS]) + " |",
+    "|:---:|" + "|".join(["---:" for _ in PREDICTORS]) + "|",
+    *[f"| {lag} |" + "".join(f" {lag_correlations[p][lag]:+.3f} |" for p in PREDICTORS) for lag in LAG_RANGE],
+]) + "\n"
+
+optimal_table_md = "\n".join([
+    "| Rank | Indicator | Optimal Lag | Correlation | p-value | Significant |",
+    "|:----:|-----------|:-----------:|:-----------:|:-------:|:-----------:|",
+    *[f"| {i} | {data['name']} | {data['optimal_lag']} months | {data['correlation']:+.3f} | {data['p_value']:.2e} | {'Yes' if data['significant'] else 'No'} |"
+      for i, (pred, data) in enumerate(ranked, 1)],
+]) + "\n"
 
 # Generate full report
 report = f"""# Phase 1: Predictive Indicator Analysis
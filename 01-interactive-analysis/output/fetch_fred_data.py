@@ -10,11 +10,21 @@ Datasets:
 - FEDFUNDS: Federal Funds Effective Rate
 """
 
+import io
 import os
-import json
-import requests
+import gzip
+import asyncio
+import hashlib
+import tempfile
+import zlib
+import functools
+import aiohttp
+import orjson
 import pandas as pd
-from datetime import datetime
+import pyarrow as pa
+import pyarrow.json as paj
+import pyarrow.compute as pc
+from datetime import date, datetime
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -25,6 +35,23 @@ load_dotenv(PROJECT_ROOT / ".env")
 FRED_API_KEY = os.getenv("FRED_API_KEY")
 FRED_BASE_URL = "https://api.stlouisfed.org/fred/series/observations"
 OUTPUT_DIR = PROJECT_ROOT / "data" / "fred"
+CACHE_DIR = OUTPUT_DIR / ".cache"
+
+# HTTP settings: one keep-alive connection pool, retrying FRED rate limits and transient errors
+MAX_CONNECTIONS = 4
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Only date/value are projected out of the FRED payload; every other field is skipped by the parser
+OBSERVATIONS_PARSE_OPTIONS = paj.ParseOptions(
+    explicit_schema=pa.schema([
+        ("observations", pa.list_(pa.struct([("date", pa.string()), ("value", pa.string())])))
+    ]),
+    unexpected_field_behavior="ignore",
+    newlines_in_values=True
+)
 
 # FRED series configuration with metadata
 SERIES_CONFIG = {
@@ -55,30 +82,100 @@ SERIES_CONFIG = {
 }
 
 
-def fetch_series(series_id: str, start_date: str = "2000-01-01") -> pd.DataFrame:
-    """Fetch a single series from FRED API"""
+def disk_cached(fetch):
+    """Cache raw FRED payloads on disk, keyed by series, start date and today's date"""
+    @functools.wraps(fetch)
+    async def wrapper(session: aiohttp.ClientSession, series_id: str, start_date: str = "2000-01-01") -> bytes:
+        key = hashlib.sha256(f"{series_id}|{start_date}|{date.today()}".encode()).hexdigest()
+        cache_path = CACHE_DIR / f"{key}.json.gz"
+
+        if cache_path.exists():
+            try:
+                payload = gzip.decompress(cache_path.read_bytes())
+            except (gzip.BadGzipFile, EOFError, zlib.error):
+                # A truncated or corrupt entry is a cache miss; the fetch below replaces it
+                pass
+            else:
+                print(f"  Cached {series_id}: {SERIES_CONFIG[series_id]['name']}")
+                return payload
+
+        payload = await fetch(session, series_id, start_date)
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file and rename it into place, so an interrupted run never leaves a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(payload))
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return payload
+
+    return wrapper
+
+
+@disk_cached
+async def fetch_series(session: aiohttp.ClientSession, series_id: str, start_date: str = "2000-01-01") -> bytes:
+    """Fetch a single series' raw JSON payload from FRED API"""
     params = {
         "series_id": series_id,
         "api_key": FRED_API_KEY,
         "file_type": "json",
         "observation_start": start_date,
-        "observation_end": datetime.now().strftime("%Y-%m-%d")
+        "observation_end": datetime.now().strftime("%Y-%m-%d"),
+        # FRED has no multi-series observations endpoint, so each series is one request;
+        # pin the ordering and maximum page size so that request is always a single page
+        "sort_order": "asc",
+        "limit": 100000
     }
 
     config = SERIES_CONFIG[series_id]
     print(f"  Fetching {series_id}: {config['name']}...")
 
-    response = requests.get(FRED_BASE_URL, params=params)
-    response.raise_for_status()
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with session.get(FRED_BASE_URL, params=params) as response:
+                if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                    response.raise_for_status()
+                    return await response.read()
+        except aiohttp.ClientResponseError:
+            # Non-retryable status, or retries exhausted
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # Connection resets, dropped payloads and timeouts are transient too
+            if attempt == MAX_RETRIES:
+                raise
+        await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
+
+
+async def fetch_all(series_ids: list) -> list:
+    """Fetch all series concurrently over one shared session"""
+    connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, keepalive_timeout=30)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(
+            *[fetch_series(session, series_id) for series_id in series_ids],
+            return_exceptions=True
+        )
+
+
+def to_dataframe(series_id: str, payload: bytes) -> pd.DataFrame:
+    """Convert a raw FRED JSON payload into a (date, series_id) DataFrame"""
+    table = paj.read_json(io.BytesIO(payload), parse_options=OBSERVATIONS_PARSE_OPTIONS)
+    observations = table.column("observations").combine_chunks().flatten()
+
+    # FRED marks missing values with "."
+    values = observations.field("value")
+    values = pc.if_else(pc.equal(values, "."), None, values)
 
-    data = response.json().get("observations", [])
-    df = pd.DataFrame(data)
-    df["date"] = pd.to_datetime(df["date"])
-    df["value"] = pd.to_numeric(df["value"], errors="coerce")
-    df = df[["date", "value"]].rename(columns={"value": series_id})
-    df = df.dropna()
+    # Missing observations are dropped in Arrow so only kept rows reach pandas
+    df = pa.table({
+        "date": pc.strptime(observations.field("date"), format="%Y-%m-%d", unit="ms"),
+        series_id: pc.cast(values, pa.float64())
+    }).drop_null().to_pandas()
 
-    print(f"     -> {len(df)} observations ({df['date'].min():%Y-%m} ~ {df['date'].max():%Y-%m})")
+    print(f"     -> {series_id}: {len(df)} observations ({df['date'].min():%Y-%m} ~ {df['date'].max():%Y-%m})")
     return df
 
 
@@ -93,37 +190,55 @@ def main():
 
     # Fetch data
     print("\n[1/3] Fetching FRED data...")
+    series_ids = list(SERIES_CONFIG)
+    results = asyncio.run(fetch_all(series_ids))
+
+    # Parse after all requests complete to keep pandas off the event loop
     dataframes = {}
-    for series_id in SERIES_CONFIG:
-        try:
-            dataframes[series_id] = fetch_series(series_id)
-        except Exception as e:
-            print(f"     Error fetching {series_id}: {e}")
+    for series_id, result in zip(series_ids, results):
+        if isinstance(result, Exception):
+            print(f"     Error fetching {series_id}: {result}")
             return
+        dataframes[series_id] = to_dataframe(series_id, result)
 
     # Merge data (monthly frequency, forward-fill quarterly data)
     print("\n[2/3] Merging data...")
-    merged = dataframes["UNRATE"][["date"]].copy()
-    for series_id, df in dataframes.items():
-        merged = merged.merge(df, on="date", how="left")
-    merged = merged.ffill()
+    # Look each series up by date on UNRATE's monthly dates (no union/join of indexes)
+    base_dates = dataframes["UNRATE"]["date"].reset_index(drop=True)
+    merged = pd.DataFrame({
+        "date": base_dates,
+        **{series_id: base_dates.map(df.set_index("date")[series_id]) for series_id, df in dataframes.items()}
+    })
+    # Only lower-frequency (quarterly) series have gaps to carry forward onto the monthly dates
+    for series_id, config in SERIES_CONFIG.items():
+        if config["frequency"] != "Monthly":
+            merged[series_id] = merged[series_id].ffill()
     print(f"     -> Merged: {len(merged)} rows, {len(merged.columns)-1} indicators")
 
     # Save files
     print("\n[3/3] Saving files...")
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Save CSV
+    # Save Parquet (analysis input, keeps datetime dtype without re-parsing).
+    # float32 holds these indicators well within correlation precision at half the size;
+    # the CSV and metadata below keep full float64 values.
+    parquet_path = OUTPUT_DIR / "consumer_credit_risk_data.parquet"
+    merged.astype({series_id: "float32" for series_id in SERIES_CONFIG}).to_parquet(
+        parquet_path, engine="pyarrow", compression="zstd", index=False
+    )
+    print(f"     Data: {parquet_path}")
+
+    # Save CSV (human-readable copy)
     csv_path = OUTPUT_DIR / "consumer_credit_risk_data.csv"
     merged.to_csv(csv_path, index=False)
     print(f"     Data: {csv_path}")
 
-    # Extract latest values
-    latest_row = merged.iloc[-1]
+    # Extract latest values (a monthly series may be published later than UNRATE)
+    latest_idx = {series_id: merged[series_id].last_valid_index() for series_id in SERIES_CONFIG}
     latest_values = {
         series_id: {
-            "value": float(latest_row[series_id]),
-            "date": latest_row["date"].strftime("%Y-%m-%d"),
+            "value": float(merged.at[latest_idx[series_id], series_id]),
+            "date": merged.at[latest_idx[series_id], "date"].strftime("%Y-%m-%d"),
             "unit": SERIES_CONFIG[series_id]["unit"]
         }
         for series_id in SERIES_CONFIG.keys()
@@ -154,8 +269,7 @@ def main():
     }
 
     json_path = OUTPUT_DIR / "consumer_credit_risk_metadata.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
+    json_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
     print(f"     Metadata: {json_path}")
 
     # Print latest values
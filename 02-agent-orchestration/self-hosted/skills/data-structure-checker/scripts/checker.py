@@ -25,14 +25,30 @@ Example:
 
 from __future__ import annotations
 
+import codecs
+import functools
 import os
+import re
+import time
 import unicodedata
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
 
 import numpy as np
 import pandas as pd
+from pandas.api.types import (
+    is_bool_dtype,
+    is_datetime64_any_dtype,
+    is_numeric_dtype,
+    is_string_dtype,
+)
+
+try:
+    import charset_normalizer
+except ImportError:
+    charset_normalizer = None
 
 # Import from the existing reader module
 # Handle both relative and absolute imports
@@ -69,6 +85,156 @@ ENCODINGS_TO_TRY = [
     'iso-8859-1', # Latin-1
 ]
 
+# Bytes read from the start of a file for encoding detection
+ENCODING_SAMPLE_SIZE = 65536
+
+# Byte order marks, longest first (the UTF-32-LE BOM starts with the UTF-16-LE one).
+# The codecs consume the BOM, so it does not end up in the first column name.
+_BOMS = (
+    (b'\xff\xfe\x00\x00', 'utf-32'),
+    (b'\x00\x00\xfe\xff', 'utf-32'),
+    (b'\xef\xbb\xbf', 'utf-8-sig'),
+    (b'\xff\xfe', 'utf-16'),
+    (b'\xfe\xff', 'utf-16'),
+)
+
+# Date-like string prefixes, one named group per field order
+_DATE_RE = re.compile(
+    r'(?P<ymd>\d{4}[-/]\d{1,2}[-/]\d{1,2})'  # 2024-01-15 or 2024/01/15
+    r'|(?P<xxy>\d{1,2}[-/]\d{1,2}[-/]\d{4})'  # 15-01-2024 or 01/15/2024
+    r'|(?P<ymd_dot>\d{4}\.\d{1,2}\.\d{1,2})'  # 2024.01.15
+)
+
+
+def _date_format(match: re.Match) -> str:
+    """
+    Map a _DATE_RE match to a pd.to_datetime format.
+
+    Like pandas' own guess, this looks at one value: day-first only when the
+    leading field cannot be a month. Values with trailing text (e.g. a time)
+    fall back to 'mixed'; ISO dates use pandas' 'ISO8601' fast path, which
+    also accepts times.
+    """
+    text = match.group()
+    separators = re.findall(r'[-/.]', text)
+    if separators[0] != separators[1]:
+        return 'mixed'
+    sep = separators[0]
+
+    if match.lastgroup == 'ymd' and sep == '-':
+        return 'ISO8601'
+    if match.end() != len(match.string):
+        return 'mixed'
+    if match.lastgroup == 'xxy':
+        day_first = int(text.split(sep)[0]) > 12
+        return f'%d{sep}%m{sep}%Y' if day_first else f'%m{sep}%d{sep}%Y'
+    return f'%Y{sep}%m{sep}%d'
+
+
+def _detect_sample_encoding(sample: bytes) -> str | None:
+    """
+    Detect the encoding of a byte sample with charset_normalizer,
+    or return None if nothing fits.
+    """
+    best = charset_normalizer.from_bytes(sample).best()
+    if best is None:
+        return None
+    encoding = codecs.lookup(best.encoding).name
+    # ASCII is a strict subset of UTF-8
+    return 'utf-8' if encoding == 'ascii' else encoding
+
+
+def _detect_streamed_encoding(path_str: str) -> str | None:
+    """
+    Return the first of ENCODINGS_TO_TRY that decodes the whole file,
+    or None if nothing fits.
+
+    The file is streamed in ENCODING_SAMPLE_SIZE chunks through an incremental
+    decoder, so non-ASCII bytes late in the file are caught with bounded memory.
+    """
+    for encoding in ENCODINGS_TO_TRY:
+        decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+        try:
+            with open(path_str, 'rb') as f:
+                while chunk := f.read(ENCODING_SAMPLE_SIZE):
+                    decoder.decode(chunk)
+            decoder.decode(b'', final=True)
+            return encoding
+        except (UnicodeDecodeError, UnicodeError):
+            continue
+    return None
+
+
+def _read_sample(path: str | Path, n: int = ENCODING_SAMPLE_SIZE) -> bytes:
+    """
+    Read up to n bytes from the start of a file with an unbuffered raw read.
+    """
+    fd = os.open(os.fspath(path), os.O_RDONLY)
+    try:
+        return os.read(fd, n)
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=128)
+def _detect_encoding_cached(path_str: str, mtime_ns: int, size: int) -> str | None:
+    """
+    Detect a file's encoding, or return None if nothing fits.
+
+    Uses charset_normalizer on a bounded sample when installed, otherwise
+    trial-decodes the whole file. mtime_ns and size are part of the cache
+    key only, so a modified file is detected again.
+    """
+    sample = _read_sample(path_str)
+
+    # Fast path: byte order marks
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    # ASCII is valid UTF-8. The streamed fallback checks the whole file, so
+    # there an ASCII sample only settles it when the sample is the whole file.
+    if sample.isascii() and sample and (charset_normalizer is not None or size <= len(sample)):
+        return 'utf-8'
+
+    if charset_normalizer is not None:
+        return _detect_sample_encoding(sample)
+    return _detect_streamed_encoding(path_str)
+
+
+@dataclass(slots=True)
+class ReadReport:
+    """
+    What smart_read detected and fixed; returned to callers as a dict.
+    """
+    file_path: str
+    timestamp_ns: int
+    issues_detected: list[str] = field(default_factory=list)
+    fixes_applied: list[str] = field(default_factory=list)
+    original_shape: tuple[int, int] | None = None
+    final_shape: tuple[int, int] | None = None
+    encoding_used: str | None = None
+    header_rows: list[int] | None = None
+    columns_renamed: list[tuple[Any, Any]] = field(default_factory=list)
+    empty_rows_removed: int = 0
+    empty_cols_removed: int = 0
+    type_conversions: dict[Any, str] = field(default_factory=dict)
+    engine_used: str = 'pandas'
+    backend: str = 'numpy'
+    projection_pushdown: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the report as a dict, formatting the timestamp as ISO 8601.
+        """
+        report = asdict(self)
+        timestamp_ns = report.pop('timestamp_ns')
+        return {
+            'file_path': report.pop('file_path'),
+            'timestamp': datetime.fromtimestamp(timestamp_ns / 1e9).isoformat(),
+            **report,
+        }
+
 
 class DataStructureChecker:
     """
@@ -82,6 +248,7 @@ class DataStructureChecker:
         trim_empty: bool = True,
         infer_types: bool = True,
         handle_duplicates: bool = True,
+        dtype_backend: Literal['numpy_nullable', 'pyarrow'] | None = None,
     ):
         """
         Initialize the DataStructureChecker.
@@ -92,19 +259,24 @@ class DataStructureChecker:
             trim_empty: Whether to remove empty rows/columns.
             infer_types: Whether to infer and convert data types.
             handle_duplicates: Whether to rename duplicate columns.
+            dtype_backend: Convert columns to nullable ('numpy_nullable') or
+                Arrow-backed ('pyarrow') dtypes after reading. None keeps
+                NumPy dtypes.
         """
         self.separator = separator
         self.max_header_rows = max_header_rows
         self.trim_empty = trim_empty
         self.infer_types = infer_types
         self.handle_duplicates = handle_duplicates
-        self._report: dict[str, Any] = {}
+        self.dtype_backend = dtype_backend
+        self._report = ReadReport(file_path='', timestamp_ns=0)
 
     def smart_read(
         self,
         file_path: str | Path,
         sheet_name: str | int = 0,
         return_report: bool = False,
+        engine: Literal['pandas', 'polars'] = 'pandas',
         **kwargs: Any,
     ) -> pd.DataFrame | tuple[pd.DataFrame, dict[str, Any]]:
         """
@@ -114,64 +286,81 @@ class DataStructureChecker:
             file_path: Path to the file.
             sheet_name: Sheet name/index for Excel files.
             return_report: If True, return (DataFrame, report) tuple.
+            engine: 'polars' reads UTF-8 CSV and Parquet files with Polars,
+                assuming a single header row. Other files, and reads with
+                kwargs beyond sep/encoding (CSV) or columns (Parquet), use pandas.
             **kwargs: Additional arguments for pandas reader.
 
         Returns:
             DataFrame, or (DataFrame, report) if return_report=True.
         """
-        self._report = {
-            'file_path': str(file_path),
-            'timestamp': datetime.now().isoformat(),
-            'issues_detected': [],
-            'fixes_applied': [],
-            'original_shape': None,
-            'final_shape': None,
-            'encoding_used': None,
-            'header_rows': None,
-            'columns_renamed': [],
-            'empty_rows_removed': 0,
-            'empty_cols_removed': 0,
-            'type_conversions': {},
-        }
+        self._report = ReadReport(
+            file_path=str(file_path),
+            timestamp_ns=time.time_ns(),
+            backend=self.dtype_backend or 'numpy',
+        )
 
         # Step 1: Resolve Unicode path
         file_path = _resolve_unicode_path(file_path)
-        if str(file_path) != self._report['file_path']:
-            self._report['issues_detected'].append('unicode_path')
-            self._report['fixes_applied'].append('Resolved Unicode path normalization')
+        if str(file_path) != self._report.file_path:
+            self._report.issues_detected.append('unicode_path')
+            self._report.fixes_applied.append('Resolved Unicode path normalization')
 
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        # One stat for the existence check and the encoding cache key
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
         ext = file_path.suffix.lower()
 
         # Step 2: Detect encoding (for CSV/TSV)
         if ext in ['.csv', '.tsv']:
-            encoding = self._detect_encoding(file_path)
-            self._report['encoding_used'] = encoding
+            encoding = self._detect_encoding(file_path, st)
+            self._report.encoding_used = encoding
             kwargs['encoding'] = encoding
 
-        # Step 3: Read with multi-level header handling
-        reader = MultiLevelReader(
-            separator=self.separator,
-            max_header_rows=self.max_header_rows,
-        )
-        df = reader.read(file_path, sheet_name=sheet_name, **kwargs)
-
-        # Get header info
-        header_info = reader.get_header_info(file_path, sheet_name)
-        self._report['header_rows'] = header_info.get('detected_header_rows', [0])
-        self._report['original_shape'] = (
-            header_info.get('total_rows', 0),
-            header_info.get('total_columns', 0)
-        )
+        # Polars fast path: its own schema inference replaces steps 3-6
+        if engine == 'polars' and ext in ['.csv', '.parquet']:
+            df = self._read_polars(file_path, ext, kwargs)
+            if df is not None:
+                self._report.engine_used = 'polars'
+                self._report.header_rows = [0]
+                self._report.final_shape = df.shape
+                if return_report:
+                    return df, self._report.to_dict()
+                return df
 
-        if len(self._report['header_rows']) > 1:
-            self._report['issues_detected'].append('multi_level_headers')
-            self._report['fixes_applied'].append(
-                f"Flattened {len(self._report['header_rows'])}-level headers with '{self.separator}' separator"
+        # Step 3: Read with multi-level header handling
+        if ext == '.parquet' and 'columns' in kwargs:
+            # Parquet is columnar with a single header: read only the requested columns
+            df = self._read_parquet_columns(file_path, kwargs)
+            self._report.projection_pushdown = True
+            self._report.header_rows = [0]
+            self._report.original_shape = df.shape
+        else:
+            reader = MultiLevelReader(
+                separator=self.separator,
+                max_header_rows=self.max_header_rows,
+            )
+            df = reader.read(file_path, sheet_name=sheet_name, **kwargs)
+            if self.dtype_backend:
+                df = df.convert_dtypes(dtype_backend=self.dtype_backend)
+
+            # Header info from the read above, without opening the file again
+            header_info = reader.last_header_info
+            self._report.header_rows = header_info.get('detected_header_rows', [0])
+            self._report.original_shape = (
+                header_info.get('total_rows', 0),
+                header_info.get('total_columns', 0)
             )
 
+            if len(self._report.header_rows) > 1:
+                self._report.issues_detected.append('multi_level_headers')
+                self._report.fixes_applied.append(
+                    f"Flattened {len(self._report.header_rows)}-level headers with '{self.separator}' separator"
+                )
+
         # Step 4: Trim empty rows/columns
         if self.trim_empty:
             df = self._trim_empty(df)
@@ -184,53 +373,199 @@ class DataStructureChecker:
         if self.infer_types:
             df = self._infer_types(df)
 
-        self._report['final_shape'] = df.shape
+        self._report.final_shape = df.shape
 
         if return_report:
-            return df, self._report
+            return df, self._report.to_dict()
         return df
 
-    def _detect_encoding(self, file_path: Path) -> str:
+    def smart_read_batches(
+        self,
+        file_path: str | Path,
+        batch_size: int = 1_000_000,
+        **kwargs: Any,
+    ) -> Iterator[pd.DataFrame]:
         """
-        Auto-detect file encoding by trying multiple encodings.
+        Read a CSV/TSV or Parquet file as DataFrames of at most batch_size rows.
+
+        Headers are detected once, from the first max_header_rows rows, and every
+        batch gets the same flattened column names. Empty-row trimming,
+        duplicate handling and type inference run per batch (empty columns
+        are kept so batches line up), so memory stays bounded
+        by batch_size rather than the file size. Other formats cannot be
+        streamed and are yielded as a single smart_read() result.
+
+        Args:
+            file_path: Path to the file.
+            batch_size: Maximum rows per batch.
+            **kwargs: Additional arguments for the pandas CSV reader,
+                or columns=[...] for Parquet.
+
+        Yields:
+            Cleaned DataFrames, in file order.
         """
-        # Try to read first few KB to detect encoding
-        sample_size = 8192
-
-        for encoding in ENCODINGS_TO_TRY:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    f.read(sample_size)
-                return encoding
-            except (UnicodeDecodeError, UnicodeError):
-                continue
+        file_path = _resolve_unicode_path(file_path)
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
 
-        # Fallback to utf-8 with error handling
-        self._report['issues_detected'].append('encoding_detection_failed')
-        self._report['fixes_applied'].append('Using utf-8 with error replacement')
-        return 'utf-8'
+        ext = file_path.suffix.lower()
+        reader = MultiLevelReader(
+            separator=self.separator,
+            max_header_rows=self.max_header_rows,
+        )
+
+        if ext in ['.csv', '.tsv']:
+            kwargs['encoding'] = self._detect_encoding(file_path, st)
+            raw_df = reader._read_raw(file_path, 'csv', sample=True, **kwargs)
+            header_rows = reader._detect_header_rows(raw_df)
+            del raw_df
+            batches = reader._read_with_headers(
+                file_path, 'csv', header_rows, chunksize=batch_size, **kwargs
+            )
+        elif ext in ['.parquet', '.pq']:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            record_batches = pq.ParquetFile(file_path).iter_batches(
+                batch_size=batch_size, columns=kwargs.get('columns')
+            )
+            # self_destruct releases each Arrow buffer as it is converted
+            batches = (
+                pa.Table.from_batches([batch]).to_pandas(self_destruct=True)
+                for batch in record_batches
+            )
+        else:
+            yield self.smart_read(file_path, **kwargs)
+            return
+
+        columns = None
+        # Closing releases the file handle even if the caller stops iterating early
+        try:
+            for df in batches:
+                self._report = ReadReport(
+                    file_path=str(file_path),
+                    timestamp_ns=time.time_ns(),
+                    backend=self.dtype_backend or 'numpy',
+                )
+                # Column names come from the header rows, so they are the same for every batch
+                if columns is None:
+                    if isinstance(df.columns, pd.MultiIndex):
+                        columns = reader._flatten_columns(df.columns)
+                    else:
+                        columns = reader._clean_column_names(df.columns)
+                df.columns = columns
+
+                if self.dtype_backend:
+                    df = df.convert_dtypes(dtype_backend=self.dtype_backend)
+                # A column empty in one batch may not be empty in the next,
+                # so only rows are trimmed to keep every batch's columns aligned
+                if self.trim_empty:
+                    df = self._trim_empty(df, columns=False)
+                if self.handle_duplicates:
+                    df = self._handle_duplicate_columns(df)
+                if self.infer_types:
+                    df = self._infer_types(df)
+                yield df
+        finally:
+            batches.close()
+
+    def _read_parquet_columns(self, file_path: Path, kwargs: dict[str, Any]) -> pd.DataFrame:
+        """
+        Read selected Parquet columns; the other column chunks are never loaded.
+        Every other reader kwarg (filters, ...) is passed through unchanged.
+        """
+        if self.dtype_backend:
+            return pd.read_parquet(
+                file_path, engine='pyarrow', dtype_backend=self.dtype_backend, **kwargs
+            )
+        return pd.read_parquet(file_path, engine='pyarrow', **kwargs)
+
+    def _read_polars(
+        self,
+        file_path: Path,
+        ext: str,
+        kwargs: dict[str, Any],
+    ) -> pd.DataFrame | None:
+        """
+        Read a CSV/Parquet file with Polars lazy scanners.
+        Returns None when Polars is not installed, cannot decode the file,
+        or kwargs carry reader options the Polars path does not translate.
+        """
+        # Anything else (usecols, nrows, dtype, ...) would be silently ignored
+        supported = {'sep', 'encoding'} if ext == '.csv' else {'columns'}
+        unsupported = sorted(set(kwargs) - supported)
+        if unsupported:
+            self._report.issues_detected.append('polars_unsupported_kwargs')
+            self._report.fixes_applied.append(
+                f"Fell back to pandas for options Polars does not handle: {', '.join(unsupported)}"
+            )
+            return None
+
+        try:
+            import polars as pl
+        except ImportError:
+            self._report.issues_detected.append('polars_unavailable')
+            return None
+
+        if ext == '.csv':
+            # Polars only decodes UTF-8
+            if kwargs.get('encoding') not in ('utf-8', 'utf-8-sig'):
+                return None
+            lf = pl.scan_csv(
+                file_path,
+                separator=kwargs.get('sep', ','),
+                infer_schema_length=10000,
+            )
+        else:
+            lf = pl.scan_parquet(file_path, parallel='auto')
+            if 'columns' in kwargs:
+                lf = lf.select(kwargs['columns'])
+                self._report.projection_pushdown = True
 
-    def _trim_empty(self, df: pd.DataFrame) -> pd.DataFrame:
+        schema = lf.collect_schema()
+        result = lf.collect()
+        self._report.original_shape = (result.height, len(schema))
+
+        if ext == '.csv':
+            return result.to_pandas(use_pyarrow_extension_array=True)
+        return result.to_pandas()
+
+    def _detect_encoding(self, file_path: Path, st: os.stat_result) -> str:
         """
-        Remove completely empty rows and columns.
+        Auto-detect file encoding from a bounded byte sample.
+        Cached per file state (taken from the caller's stat result), so
+        diagnose() + smart_read() detect only once.
         """
-        original_shape = df.shape
+        encoding = _detect_encoding_cached(str(file_path), st.st_mtime_ns, st.st_size)
+        if encoding is not None:
+            return encoding
 
-        # Remove rows where all values are NaN
-        df = df.dropna(how='all')
-        rows_removed = original_shape[0] - df.shape[0]
+        # Fallback to utf-8 with error handling
+        self._report.issues_detected.append('encoding_detection_failed')
+        self._report.fixes_applied.append('Using utf-8 with error replacement')
+        return 'utf-8'
 
-        # Remove columns where all values are NaN
-        df = df.dropna(axis=1, how='all')
-        cols_removed = original_shape[1] - df.shape[1]
+    def _trim_empty(self, df: pd.DataFrame, columns: bool = True) -> pd.DataFrame:
+        """
+        Remove completely empty rows and (unless columns=False) columns.
+        """
+        # One NaN mask gives both the empty rows and the empty columns
+        is_na = df.isna().to_numpy()
+        row_keep = ~is_na.all(axis=1)
+        col_keep = ~is_na.all(axis=0) if columns else np.ones(is_na.shape[1], dtype=bool)
+        rows_removed = int(len(row_keep) - row_keep.sum())
+        cols_removed = int(len(col_keep) - col_keep.sum())
 
         if rows_removed > 0 or cols_removed > 0:
-            self._report['issues_detected'].append('empty_rows_or_columns')
-            self._report['fixes_applied'].append(
+            df = df.iloc[row_keep.nonzero()[0], col_keep.nonzero()[0]]
+            self._report.issues_detected.append('empty_rows_or_columns')
+            self._report.fixes_applied.append(
                 f"Removed {rows_removed} empty rows and {cols_removed} empty columns"
             )
-            self._report['empty_rows_removed'] = rows_removed
-            self._report['empty_cols_removed'] = cols_removed
+            self._report.empty_rows_removed = rows_removed
+            self._report.empty_cols_removed = cols_removed
 
         return df
 
@@ -238,28 +573,24 @@ class DataStructureChecker:
         """
         Rename duplicate column names by adding suffixes.
         """
-        cols = df.columns.tolist()
-        seen = {}
-        new_cols = []
-        renamed = []
-
-        for col in cols:
-            if col in seen:
-                seen[col] += 1
-                new_name = f"{col}_{seen[col]}"
-                new_cols.append(new_name)
-                renamed.append((col, new_name))
-            else:
-                seen[col] = 0
-                new_cols.append(col)
-
-        if renamed:
-            df.columns = new_cols
-            self._report['issues_detected'].append('duplicate_columns')
-            self._report['fixes_applied'].append(
+        # Common case: no duplicates, nothing to build
+        if df.columns.is_unique:
+            return df
+
+        cols = pd.Series(df.columns, dtype=object)
+        # Occurrence number of each name: 0 for the first, 1 for the second, ...
+        occurrence = cols.groupby(cols, dropna=False).cumcount()
+        is_dup = occurrence > 0
+
+        if is_dup.any():
+            new_cols = cols.where(~is_dup, cols.astype(str) + '_' + occurrence.astype(str))
+            renamed = list(zip(cols[is_dup], new_cols[is_dup]))
+            df.columns = new_cols.to_numpy()
+            self._report.issues_detected.append('duplicate_columns')
+            self._report.fixes_applied.append(
                 f"Renamed {len(renamed)} duplicate columns"
             )
-            self._report['columns_renamed'] = renamed
+            self._report.columns_renamed = renamed
 
         return df
 
@@ -268,66 +599,87 @@ class DataStructureChecker:
         Infer and convert data types for each column.
         """
         conversions = {}
-
-        for col in df.columns:
-            original_dtype = str(df[col].dtype)
-
-            # Skip if already numeric or datetime
-            if df[col].dtype in ['int64', 'float64', 'datetime64[ns]']:
+        numeric_kwargs = {'dtype_backend': self.dtype_backend} if self.dtype_backend else {}
+
+        # Candidates are string columns (object, or string dtypes from
+        # dtype_backend); skip columns the reader already typed
+        obj_cols = [
+            col for col, dtype in df.dtypes.items()
+            if is_string_dtype(dtype) and not (
+                is_numeric_dtype(dtype)
+                or is_datetime64_any_dtype(dtype)
+                or is_bool_dtype(dtype)
+                or isinstance(dtype, pd.CategoricalDtype)
+            )
+        ]
+        if not obj_cols:
+            return df
+
+        candidates = df[obj_cols]
+        original_dtypes = candidates.dtypes
+        # to_numeric mis-parses ArrowDtype strings; StringDtype shares
+        # the same Arrow buffers and converts correctly
+        arrow_cols = [col for col in obj_cols if isinstance(original_dtypes[col], pd.ArrowDtype)]
+        if arrow_cols:
+            candidates = candidates.astype({col: 'string[pyarrow]' for col in arrow_cols})
+
+        # Try numeric conversion on all candidates at once
+        non_null_original = candidates.notna().sum()
+        numeric = candidates.apply(pd.to_numeric, errors='coerce', **numeric_kwargs)
+        non_null_numeric = numeric.notna().sum()
+
+        # If most values convert successfully (>80%), use numeric
+        has_values = non_null_original > 0
+        accepted = has_values & (non_null_numeric / non_null_original > 0.8)
+        accepted_cols = list(accepted.index[accepted])
+        if accepted_cols:
+            df[accepted_cols] = numeric[accepted_cols]
+
+        for col in obj_cols:
+            original_dtype = str(original_dtypes[col])
+            if accepted[col]:
+                conversions[col] = f"{original_dtype} -> {numeric[col].dtype}"
+                continue
+            if not has_values[col]:
                 continue
 
-            # Try numeric conversion
-            if df[col].dtype == 'object':
-                # Try to convert to numeric
-                numeric_col = pd.to_numeric(df[col], errors='coerce')
-                non_null_original = df[col].notna().sum()
-                non_null_numeric = numeric_col.notna().sum()
-
-                # If most values convert successfully (>80%), use numeric
-                if non_null_original > 0 and (non_null_numeric / non_null_original) > 0.8:
-                    df[col] = numeric_col
-                    conversions[col] = f"{original_dtype} -> {df[col].dtype}"
-                    continue
-
-                # Try datetime conversion for date-like strings
-                if self._looks_like_date(df[col]):
-                    try:
-                        df[col] = pd.to_datetime(df[col], errors='coerce')
-                        if df[col].notna().sum() > 0:
-                            conversions[col] = f"{original_dtype} -> datetime64"
-                    except Exception:
-                        pass
+            # Try datetime conversion for date-like strings
+            s = candidates[col]
+            date_format = self._looks_like_date(s)
+            if date_format:
+                try:
+                    df[col] = pd.to_datetime(s, errors='coerce', format=date_format, cache=True)
+                    if df[col].notna().sum() > 0:
+                        conversions[col] = f"{original_dtype} -> datetime64"
+                except Exception:
+                    pass
 
         if conversions:
-            self._report['issues_detected'].append('type_inference')
-            self._report['fixes_applied'].append(
+            self._report.issues_detected.append('type_inference')
+            self._report.fixes_applied.append(
                 f"Converted data types for {len(conversions)} columns"
             )
-            self._report['type_conversions'] = conversions
+            self._report.type_conversions = conversions
 
         return df
 
-    def _looks_like_date(self, series: pd.Series) -> bool:
+    def _looks_like_date(self, series: pd.Series) -> str | None:
         """
         Check if a series contains date-like strings.
+        Returns the pd.to_datetime format of the first one, or None.
         """
-        sample = series.dropna().head(10)
-        if len(sample) == 0:
-            return False
-
-        date_patterns = [
-            r'\d{4}[-/]\d{1,2}[-/]\d{1,2}',  # 2024-01-15 or 2024/01/15
-            r'\d{1,2}[-/]\d{1,2}[-/]\d{4}',  # 15-01-2024 or 15/01/2024
-            r'\d{4}\.\d{1,2}\.\d{1,2}',      # 2024.01.15
-        ]
-
-        import re
-        for val in sample:
-            if isinstance(val, str):
-                for pattern in date_patterns:
-                    if re.match(pattern, val.strip()):
-                        return True
-        return False
+        # Walk the values positionally and stop after 10 non-empty strings,
+        # rather than copying the whole non-null column
+        checked = 0
+        for val in series.to_numpy():
+            if isinstance(val, str) and val:
+                match = _DATE_RE.match(val.strip())
+                if match:
+                    return _date_format(match)
+                checked += 1
+                if checked == 10:
+                    break
+        return None
 
     def diagnose(
         self,
@@ -341,22 +693,29 @@ class DataStructureChecker:
         file_path = _resolve_unicode_path(file_path)
         ext = file_path.suffix.lower()
 
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            st = None
+
         diagnosis = {
             'file_path': str(file_path),
-            'file_exists': file_path.exists(),
+            'file_exists': st is not None,
             'file_extension': ext,
             'issues': [],
             'recommendations': [],
         }
 
-        if not file_path.exists():
+        if st is None:
             diagnosis['issues'].append('file_not_found')
             return diagnosis
 
         # Check encoding for CSV
+        read_kwargs = {}
         if ext in ['.csv', '.tsv']:
-            encoding = self._detect_encoding(file_path)
-            if encoding != 'utf-8':
+            encoding = self._detect_encoding(file_path, st)
+            read_kwargs['encoding'] = encoding
+            if encoding not in ('utf-8', 'utf-8-sig'):
                 diagnosis['issues'].append(f'non_utf8_encoding:{encoding}')
                 diagnosis['recommendations'].append(
                     f"File uses {encoding} encoding, will auto-convert"
@@ -364,7 +723,7 @@ class DataStructureChecker:
 
         # Check headers
         reader = MultiLevelReader(separator=self.separator)
-        header_info = reader.get_header_info(file_path, sheet_name)
+        header_info = reader.get_header_info(file_path, sheet_name, **read_kwargs)
 
         if header_info.get('header_count', 1) > 1:
             diagnosis['issues'].append('multi_level_headers')
@@ -382,6 +741,8 @@ def smart_read(
     separator: str = '_',
     return_report: bool = False,
     sheet_name: str | int = 0,
+    engine: Literal['pandas', 'polars'] = 'pandas',
+    dtype_backend: Literal['numpy_nullable', 'pyarrow'] | None = None,
     **kwargs: Any,
 ) -> pd.DataFrame | tuple[pd.DataFrame, dict[str, Any]]:
     """
@@ -401,6 +762,10 @@ def smart_read(
         separator: Character(s) for joining multi-level headers (default: '_').
         return_report: If True, return (DataFrame, report) tuple.
         sheet_name: Sheet name/index for Excel files.
+        engine: 'pandas' (default) or 'polars' for a faster CSV/Parquet read
+            that skips header detection, trimming and type inference.
+        dtype_backend: 'pyarrow' for Arrow-backed columns (less memory for
+            strings), 'numpy_nullable' for nullable dtypes, None for NumPy.
         **kwargs: Additional arguments for pandas reader.
 
     Returns:
@@ -411,15 +776,45 @@ def smart_read(
         >>> df, report = smart_read('data.xlsx', return_report=True)
         >>> print(report['fixes_applied'])
     """
-    checker = DataStructureChecker(separator=separator)
+    checker = DataStructureChecker(separator=separator, dtype_backend=dtype_backend)
     return checker.smart_read(
         file_path,
         sheet_name=sheet_name,
         return_report=return_report,
+        engine=engine,
         **kwargs,
     )
 
 
+def smart_read_batches(
+    file_path: str | Path,
+    batch_size: int = 1_000_000,
+    separator: str = '_',
+    **kwargs: Any,
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a large CSV/TSV or Parquet file in bounded-memory batches.
+
+    Each batch gets the same fixes as smart_read(). Headers are detected
+    once, so all batches share the same column names.
+
+    Args:
+        file_path: Path to the file to read.
+        batch_size: Maximum rows per batch (default: 1,000,000).
+        separator: Character(s) for joining multi-level headers (default: '_').
+        **kwargs: Additional arguments for the pandas CSV reader.
+
+    Yields:
+        DataFrames ready for analysis, in file order.
+
+    Example:
+        >>> for batch in smart_read_batches('big.csv', batch_size=500_000):
+        ...     batch.to_parquet(...)
+    """
+    checker = DataStructureChecker(separator=separator)
+    yield from checker.smart_read_batches(file_path, batch_size=batch_size, **kwargs)
+
+
 def diagnose(
     file_path: str | Path,
     sheet_name: str | int = 0,
@@ -18,14 +18,123 @@ Example:
 
 from __future__ import annotations
 
+import functools
+import importlib.util
+import itertools
 import os
 import re
 import unicodedata
+from concurrent.futures import Executor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Iterable, Literal
 
+import numpy as np
 import pandas as pd
 
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
+# Engines for spreadsheet reads: calamine (Rust) is much faster than openpyxl/odf.
+# MLR_EXCEL_ENGINE overrides the Excel engine, e.g. 'openpyxl'.
+_EXCEL_ENGINE = os.environ.get('MLR_EXCEL_ENGINE', 'calamine' if python_calamine is not None else None)
+_ODS_ENGINE = 'calamine' if python_calamine is not None else 'odf'
+
+# ID-like strings (matched against the stripped value):
+_ID_LIKE_RE = re.compile(
+    r'[0-9A-Fa-f]{16,}'                    # hex codes, 16+ chars
+    r'|[^\W_]*(?:-[^\W_]*){2,}'            # UUID-like: 3+ hyphen-separated alphanumeric parts
+    r'|(?=.*\d)(?=.*[^\W\d_])[^\W_]{16,}'  # long alphanumeric with letters and digits
+)
+
+# pyarrow (Parquet footer reads), checked without paying for the import
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+@functools.lru_cache(maxsize=8192)
+def _norm(form: Literal['NFC', 'NFD'], text: str) -> str:
+    """unicodedata.normalize, memoized for names that are resolved repeatedly."""
+    return unicodedata.normalize(form, text)
+
+
+@functools.lru_cache(maxsize=256)
+def _dir_nfc_index(parent: str, mtime_ns: int) -> dict[str, str]:
+    """
+    Map the NFC form of each name in a directory to its on-disk name.
+
+    mtime_ns is part of the cache key only, so the index is rebuilt once
+    the directory changes.
+    """
+    return {_norm('NFC', name): name for name in os.listdir(parent)}
+
+
+def _read_spreadsheet(file_path: Path, kwargs: dict[str, Any]) -> pd.DataFrame:
+    """Read an Excel/ODS sheet; kwargs carry the sheet_name and engine."""
+    return pd.read_excel(file_path, **kwargs)
+
+
+def _read_csv(file_path: Path, kwargs: dict[str, Any]) -> pd.DataFrame:
+    """
+    Read a CSV/TSV file. kwargs must include the encoding; it is filled in
+    and passed on as is.
+
+    This stays on the default C engine: the pyarrow engine parses ISO dates
+    to datetime.date objects and names blank header cells '' instead of
+    'Unnamed: N', which the checker's type inference and column cleaning
+    do not expect.
+    """
+    kwargs.setdefault('sep', ',' if file_path.suffix == '.csv' else '\t')
+    return pd.read_csv(file_path, **kwargs)
+
+
+def _read_parquet(file_path: Path, kwargs: dict[str, Any]) -> pd.DataFrame:
+    """Read a Parquet file."""
+    # Parquet files have named columns, not header rows
+    kwargs.pop('header', None)
+    return pd.read_parquet(file_path, **kwargs)
+
+
+# Reader for each format type, called as reader(file_path, kwargs)
+_FORMAT_READERS = {
+    'excel': _read_spreadsheet,
+    'csv': _read_csv,
+    'ods': _read_spreadsheet,
+    'parquet': _read_parquet,
+}
+
+# Default engine for each spreadsheet format type
+_SPREADSHEET_ENGINES = {
+    'excel': _EXCEL_ENGINE,
+    'ods': _ODS_ENGINE,
+}
+
+
+def _parse_file(file_path: Path, format_type: str, kwargs: dict[str, Any]) -> pd.DataFrame:
+    """Dispatch a read to the pandas reader for the format."""
+    try:
+        read = _FORMAT_READERS[format_type]
+    except KeyError:
+        raise ValueError(f"Unknown format type: {format_type}") from None
+    return read(file_path, kwargs)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_file_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    format_type: str,
+    options: tuple[tuple[str, Any], ...],
+) -> pd.DataFrame:
+    """
+    Memoized _parse_file for the max_header_rows header samples, so e.g.
+    analyze_headers() followed by read_multi_level() on a CSV samples it
+    once. mtime_ns and size are part of the cache key only, so a changed
+    file is read again. Callers must copy the result before modifying it.
+    """
+    return _parse_file(Path(path_str), format_type, dict(options))
+
 
 def _resolve_unicode_path(file_path: str | Path) -> Path:
     """
@@ -36,39 +145,42 @@ def _resolve_unicode_path(file_path: str | Path) -> Path:
     to find the actual file.
     """
     file_path = Path(file_path)
+    path_str = str(file_path)
+
+    # Fast path: a string that is both NFC and NFD (e.g. ASCII) has no other
+    # normalized spelling to look for, so there is nothing to resolve
+    if (
+        unicodedata.is_normalized('NFC', path_str)
+        and unicodedata.is_normalized('NFD', path_str)
+    ):
+        return file_path
 
     # Try original path first
     if file_path.exists():
         return file_path
 
     # Try with different Unicode normalizations
-    path_str = str(file_path)
 
     # Try NFC normalization
-    nfc_path = Path(unicodedata.normalize('NFC', path_str))
+    nfc_path = Path(_norm('NFC', path_str))
     if nfc_path.exists():
         return nfc_path
 
     # Try NFD normalization
-    nfd_path = Path(unicodedata.normalize('NFD', path_str))
+    nfd_path = Path(_norm('NFD', path_str))
     if nfd_path.exists():
         return nfd_path
 
-    # If parent exists, try to find matching file in parent directory
+    # If parent exists, look the name up in its directory index; equal NFC
+    # forms also means equal NFD forms, so one index covers both
     parent = file_path.parent
-    if parent.exists():
-        target_name = file_path.name
-        target_nfc = unicodedata.normalize('NFC', target_name)
-        target_nfd = unicodedata.normalize('NFD', target_name)
-
-        for actual_file in parent.iterdir():
-            actual_name = actual_file.name
-            if actual_name == target_name:
-                return actual_file
-            if unicodedata.normalize('NFC', actual_name) == target_nfc:
-                return actual_file
-            if unicodedata.normalize('NFD', actual_name) == target_nfd:
-                return actual_file
+    try:
+        index = _dir_nfc_index(str(parent), os.stat(parent).st_mtime_ns)
+    except OSError:
+        index = {}
+    actual_name = index.get(_norm('NFC', file_path.name))
+    if actual_name is not None:
+        return parent / actual_name
 
     # Return original path (will fail with FileNotFoundError later)
     return file_path
@@ -77,6 +189,8 @@ def _resolve_unicode_path(file_path: str | Path) -> Path:
 class MultiLevelReader:
     """Reader for tabular files with multi-level headers."""
 
+    __slots__ = ('separator', 'max_header_rows', 'encoding', 'last_header_info')
+
     SUPPORTED_FORMATS = {
         '.xlsx': 'excel',
         '.xls': 'excel',
@@ -104,6 +218,8 @@ class MultiLevelReader:
         self.separator = separator
         self.max_header_rows = max_header_rows
         self.encoding = encoding
+        # Header info from the most recent read(), same shape as get_header_info()
+        self.last_header_info: dict[str, Any] | None = None
 
     def read(
         self,
@@ -142,54 +258,145 @@ class MultiLevelReader:
 
         format_type = self.SUPPORTED_FORMATS[ext]
 
+        # Excel/ODS without reader kwargs are parsed once and split below;
+        # otherwise the raw read only needs the rows header detection looks at
+        split_raw = format_type in ('excel', 'ods') and not kwargs
+        sample = format_type != 'parquet' and not split_raw
+
         # Read raw data to detect headers
-        raw_df = self._read_raw(file_path, format_type, sheet_name, **kwargs)
+        raw_df = self._read_raw(file_path, format_type, sheet_name, sample=sample, **kwargs)
 
         # Determine header rows
-        if header_rows == 'auto':
+        if format_type == 'parquet':
+            # Parquet columns are already named; there are no header rows to detect
+            header_rows = [0]
+        elif header_rows == 'auto':
             header_rows = self._detect_header_rows(raw_df)
         elif isinstance(header_rows, int):
             header_rows = list(range(header_rows))
 
-        # Re-read with proper header specification
-        df = self._read_with_headers(
-            file_path, format_type, header_rows, sheet_name, **kwargs
+        if format_type == 'parquet':
+            df = raw_df
+        elif split_raw:
+            # Split the raw read instead of parsing the workbook a second time
+            df = self._split_raw(raw_df, header_rows)
+        else:
+            # Re-read with proper header specification
+            df = self._read_with_headers(
+                file_path, format_type, header_rows, sheet_name, **kwargs
+            )
+
+        # A sampled raw read does not know the file's length; the full read does
+        total_rows = max(header_rows) + 1 + len(df) if sample else len(raw_df)
+        self.last_header_info = self._build_header_info(
+            file_path, format_type, raw_df, header_rows, total_rows
         )
 
-        # Flatten multi-level columns
+        self._set_column_names(df)
+
+        return df
+
+    def read_all_sheets(
+        self,
+        file_path: str | Path,
+        header_rows: int | list[int] | Literal['auto'] = 'auto',
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Read every sheet of an Excel/ODS workbook, each with flattened column names.
+
+        The workbook is opened and parsed once and each sheet's header rows are
+        split off in memory, instead of re-reading the file for every sheet.
+
+        Args:
+            file_path: Path to the Excel/ODS file.
+            header_rows: Number of header rows, list of row indices, or 'auto'
+                to detect them per sheet.
+
+        Returns:
+            Dictionary mapping sheet names to DataFrames, in workbook order.
+
+        Raises:
+            ValueError: If the file is not an Excel/ODS workbook.
+            FileNotFoundError: If file does not exist.
+        """
+        file_path = _resolve_unicode_path(file_path)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        ext = file_path.suffix.lower()
+        format_type = self.SUPPORTED_FORMATS.get(ext)
+        if format_type not in _SPREADSHEET_ENGINES:
+            spreadsheet_exts = [e for e, f in self.SUPPORTED_FORMATS.items() if f in _SPREADSHEET_ENGINES]
+            raise ValueError(
+                f"Unsupported file format for read_all_sheets: {ext}. "
+                f"Supported formats: {spreadsheet_exts}"
+            )
+
+        # sheet_name=None parses all sheets in one pass over the workbook
+        kwargs = {'header': None}
+        self._fill_read_defaults(format_type, None, kwargs)
+        raw_sheets = _parse_file(file_path, format_type, kwargs)
+
+        sheets = {}
+        for name, raw_df in raw_sheets.items():
+            if header_rows == 'auto':
+                sheet_header_rows = self._detect_header_rows(raw_df)
+            elif isinstance(header_rows, int):
+                sheet_header_rows = list(range(header_rows))
+            else:
+                sheet_header_rows = header_rows
+
+            df = self._split_raw(raw_df, sheet_header_rows)
+            self._set_column_names(df)
+            sheets[name] = df
+
+        return sheets
+
+    def _set_column_names(self, df: pd.DataFrame) -> None:
+        """Flatten multi-level columns or clean single-level ones, in place."""
         if isinstance(df.columns, pd.MultiIndex):
             df.columns = self._flatten_columns(df.columns)
         else:
             # Single-level but may need cleaning from auto-detection
             df.columns = self._clean_column_names(df.columns)
 
-        return df
-
     def _read_raw(
         self,
         file_path: Path,
         format_type: str,
         sheet_name: str | int = 0,
+        sample: bool = False,
         **kwargs: Any,
     ) -> pd.DataFrame:
-        """Read file without header processing for inspection."""
-        kwargs_copy = kwargs.copy()
-        kwargs_copy['header'] = None
+        """
+        Read file without header processing for inspection.
+        With sample=True, only the first max_header_rows rows are parsed.
+        """
+        # **kwargs is already a dict of this call's own, so fill it in place
+        kwargs['header'] = None
+        if sample and format_type != 'parquet':
+            kwargs.setdefault('nrows', self.max_header_rows)
 
-        if format_type == 'excel':
-            return pd.read_excel(file_path, sheet_name=sheet_name, **kwargs_copy)
-        elif format_type == 'csv':
-            encoding = kwargs_copy.pop('encoding', self.encoding)
-            sep = kwargs_copy.pop('sep', ',' if file_path.suffix == '.csv' else '\t')
-            return pd.read_csv(file_path, encoding=encoding, sep=sep, **kwargs_copy)
-        elif format_type == 'ods':
-            return pd.read_excel(file_path, sheet_name=sheet_name, engine='odf', **kwargs_copy)
-        elif format_type == 'parquet':
-            # Parquet files typically don't have multi-level headers in the same way
-            df = pd.read_parquet(file_path, **kwargs_copy)
-            return df
-
-        raise ValueError(f"Unknown format type: {format_type}")
+        self._fill_read_defaults(format_type, sheet_name, kwargs)
+
+        # Only the small header samples are memoized; full reads are never
+        # kept in memory beyond the caller's own frame
+        if sample and format_type != 'parquet':
+            options = tuple(sorted(kwargs.items()))
+            try:
+                hash(options)
+            except TypeError:
+                # e.g. a usecols list or dtype dict
+                pass
+            else:
+                st = file_path.stat()
+                raw_df = _parse_file_cached(
+                    str(file_path), st.st_mtime_ns, st.st_size, format_type, options
+                )
+                return raw_df.copy()
+
+        return _parse_file(file_path, format_type, kwargs)
 
     def _read_with_headers(
         self,
@@ -200,21 +407,50 @@ class MultiLevelReader:
         **kwargs: Any,
     ) -> pd.DataFrame:
         """Read file with specified header rows."""
-        kwargs_copy = kwargs.copy()
-        kwargs_copy['header'] = header_rows if len(header_rows) > 1 else header_rows[0]
+        kwargs['header'] = header_rows if len(header_rows) > 1 else header_rows[0]
+        self._fill_read_defaults(format_type, sheet_name, kwargs)
 
-        if format_type == 'excel':
-            return pd.read_excel(file_path, sheet_name=sheet_name, **kwargs_copy)
+        return _parse_file(file_path, format_type, kwargs)
+
+    def _fill_read_defaults(
+        self,
+        format_type: str,
+        sheet_name: str | int,
+        kwargs: dict[str, Any],
+    ) -> None:
+        """Add the per-format reader options (sheet, engine, encoding) to kwargs."""
+        if format_type in _SPREADSHEET_ENGINES:
+            kwargs['sheet_name'] = sheet_name
+            kwargs.setdefault('engine', _SPREADSHEET_ENGINES[format_type])
         elif format_type == 'csv':
-            encoding = kwargs_copy.pop('encoding', self.encoding)
-            sep = kwargs_copy.pop('sep', ',' if file_path.suffix == '.csv' else '\t')
-            return pd.read_csv(file_path, encoding=encoding, sep=sep, **kwargs_copy)
-        elif format_type == 'ods':
-            return pd.read_excel(file_path, sheet_name=sheet_name, engine='odf', **kwargs_copy)
-        elif format_type == 'parquet':
-            return pd.read_parquet(file_path, **kwargs_copy)
+            kwargs.setdefault('encoding', self.encoding)
 
-        raise ValueError(f"Unknown format type: {format_type}")
+    def _split_raw(self, raw_df: pd.DataFrame, header_rows: list[int]) -> pd.DataFrame:
+        """
+        Build the headed DataFrame from a raw (header=None) read.
+
+        The header rows become the columns (a MultiIndex for several rows) and
+        the rows after them the data. Blank header cells stay NaN and are
+        filled in by _flatten_columns/_clean_column_names.
+        """
+        # An empty sheet has no header rows to take; a headed read returns it as is
+        if raw_df.empty:
+            return raw_df
+
+        # A numeric header cell over a float column comes back as e.g. 2024.0
+        header = [
+            [int(v) if isinstance(v, float) and v.is_integer() else v for v in raw_df.iloc[i]]
+            for i in header_rows
+        ]
+        if len(header) > 1:
+            columns = pd.MultiIndex.from_arrays(header)
+        else:
+            columns = pd.Index(header[0])
+
+        df = raw_df.iloc[max(header_rows) + 1:].reset_index(drop=True)
+        df.columns = columns
+        # Header cells made every raw column object; recover the data's dtypes
+        return df.infer_objects()
 
     def _detect_header_rows(self, raw_df: pd.DataFrame) -> list[int]:
         """
@@ -229,25 +465,59 @@ class MultiLevelReader:
         if raw_df.empty:
             return [0]
 
-        header_candidates = []
-        total_cols = len(raw_df.columns)
+        # Type counts for every candidate row in one pass over the top slice,
+        # with the same rules as _analyze_row
+        top = raw_df.head(self.max_header_rows).to_numpy(dtype=object)
+        n_rows, total_cols = top.shape
+        values = top.ravel()
+
+        # Row by row, boolean columns of a mixed-dtype frame came out as np.bool_,
+        # which is not numeric; the whole-frame array holds Python bools instead.
+        # An all-boolean frame kept Python bools, so they stay numeric there
+        bool_cols = np.fromiter((dt.kind == 'b' for dt in raw_df.dtypes), dtype=bool, count=total_cols)
+        if bool_cols.all():
+            bool_cols[:] = False
+        bool_cols = np.tile(bool_cols, n_rows)
+
+        is_null = pd.isna(values)
+        is_numeric = ~is_null & ~bool_cols & np.fromiter(
+            (isinstance(v, (int, float, np.number)) for v in values), dtype=bool, count=values.size
+        )
+        is_string = np.fromiter(
+            (isinstance(v, str) for v in values), dtype=bool, count=values.size
+        ).reshape(n_rows, total_cols)
+
+        fill_ratios = (total_cols - is_null.reshape(n_rows, total_cols).sum(axis=1)) / total_cols
+        numeric_counts = is_numeric.reshape(n_rows, total_cols).sum(axis=1)
+
+        # ID-like strings only matter for dense rows without numbers before the
+        # first data row (sparse rows are headers either way), so the regex
+        # pass covers just those rows, and is skipped if there are none
+        data_rows = np.flatnonzero(numeric_counts)
+        n_undecided = data_rows[0] if data_rows.size else n_rows
+        needs_ids = np.zeros(n_rows, dtype=bool)
+        needs_ids[:n_undecided] = fill_ratios[:n_undecided] >= 0.5
+
+        is_id_like = np.zeros((n_rows, total_cols), dtype=bool)
+        if needs_ids.any():
+            check = is_string & needs_ids[:, None]
+            is_id_like[check] = self._id_like_mask(top[check])
+        id_like_counts = is_id_like.sum(axis=1)
 
-        for row_idx in range(min(self.max_header_rows, len(raw_df))):
-            row = raw_df.iloc[row_idx]
-            analysis = self._analyze_row(row)
+        header_candidates = []
 
+        for row_idx in range(n_rows):
             # A row is a header if:
             # 1. It has no numeric values (actual int/float types)
             # 2. It has no ID-like patterns (hex strings, UUIDs)
             # 3. OR it's very sparse (header categories)
             is_header = (
-                analysis['numeric_count'] == 0 and
-                analysis['id_like_count'] == 0
+                numeric_counts[row_idx] == 0 and
+                id_like_counts[row_idx] == 0
             )
 
             # Also consider sparse rows with all strings as headers
-            fill_ratio = analysis['non_null_count'] / total_cols
-            if fill_ratio < 0.5 and analysis['numeric_count'] == 0:
+            if fill_ratios[row_idx] < 0.5 and numeric_counts[row_idx] == 0:
                 is_header = True
 
             if is_header:
@@ -272,66 +542,41 @@ class MultiLevelReader:
         - numeric_count: Number of actual numeric values (int/float types)
         - id_like_count: Number of ID-like strings (hex codes, alphanumeric)
         """
-        non_null_values = row.dropna()
-
-        string_count = 0
-        numeric_count = 0
-        id_like_count = 0
-
-        for val in non_null_values:
-            if isinstance(val, (int, float)):
-                # Actual numeric type
-                numeric_count += 1
-            elif isinstance(val, str):
-                # Check if it's an ID-like string
-                if self._is_id_like(val):
-                    id_like_count += 1
-                string_count += 1
+        values = row.dropna().to_numpy(dtype=object)
+        n = len(values)
+
+        # Type masks over the object array; np.number covers the numpy
+        # scalars (e.g. np.int64) that rows of mixed-dtype frames hold
+        is_numeric = np.fromiter(
+            (isinstance(v, (int, float, np.number)) for v in values), dtype=bool, count=n
+        )
+        is_string = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=n)
 
         return {
-            'non_null_count': len(non_null_values),
-            'string_count': string_count,
-            'numeric_count': numeric_count,
-            'id_like_count': id_like_count,
+            'non_null_count': n,
+            'string_count': int(is_string.sum()),
+            'numeric_count': int(is_numeric.sum()),
+            'id_like_count': int(self._id_like_mask(values[is_string]).sum()),
         }
 
+    def _id_like_mask(self, strings: np.ndarray) -> np.ndarray:
+        """Mask the ID-like values (see _is_id_like) of an array of strings."""
+        # One vectorized regex pass instead of a _is_id_like call per string
+        strings = pd.Series(strings, dtype=object)
+        return ((strings.str.len() >= 8) & strings.str.strip().str.fullmatch(_ID_LIKE_RE)).to_numpy(dtype=bool)
+
     def _is_id_like(self, val: str) -> bool:
         """
         Check if a string looks like an ID (hex code, UUID, alphanumeric ID).
 
-        ID patterns:
-        - Hex strings: at least 8 chars, all hex digits
-        - UUID-like: contains hyphens with alphanumeric segments
-        - Long alphanumeric: 10+ chars, mix of letters and digits
-        """
-        if not val or len(val) < 8:
-            return False
-
-        val_clean = val.strip()
+        ID patterns (strings shorter than 8 chars never match):
+        - Hex strings: at least 16 chars, all hex digits
+        - UUID-like: 3+ hyphen-separated alphanumeric segments
+        - Long alphanumeric: 16+ chars, mix of letters and digits
 
-        # Check for hex-like strings (at least 16 chars of hex)
-        if len(val_clean) >= 16:
-            try:
-                int(val_clean, 16)
-                return True
-            except ValueError:
-                pass
-
-        # Check for UUID-like patterns (8-4-4-4-12 or similar)
-        if '-' in val_clean:
-            parts = val_clean.split('-')
-            if len(parts) >= 3:
-                if all(p.isalnum() for p in parts if p):
-                    return True
-
-        # Check for long alphanumeric strings that look like IDs
-        if len(val_clean) >= 16 and val_clean.isalnum():
-            has_digit = any(c.isdigit() for c in val_clean)
-            has_letter = any(c.isalpha() for c in val_clean)
-            if has_digit and has_letter:
-                return True
-
-        return False
+        One _ID_LIKE_RE match; no int(val, 16) attempt raising ValueError.
+        """
+        return len(val) >= 8 and _ID_LIKE_RE.fullmatch(val.strip()) is not None
 
     def _is_header_row(self, row: pd.Series) -> bool:
         """
@@ -350,36 +595,27 @@ class MultiLevelReader:
         - Unnamed columns - removes or propagates parent
         - Duplicate separators - cleans up
         """
-        flattened = []
-
-        # Get number of levels
-        n_levels = columns.nlevels
+        n_cols = len(columns)
+        positions = np.arange(n_cols)
 
-        # Forward-fill parent names for merged cells
-        prev_names = [None] * n_levels
+        # Forward-fill parent names for merged cells, one level at a time:
+        # NaN and Unnamed entries take the index of the last named entry
+        levels = []
+        for level_idx in range(columns.nlevels):
+            values = pd.Series(columns.get_level_values(level_idx), dtype=object)
+            missing = self._unnamed_mask(values)
 
-        for col_tuple in columns:
-            parts = []
+            source = np.where(missing, -1, positions)
+            np.maximum.accumulate(source, out=source)
 
-            for level_idx, name in enumerate(col_tuple):
-                # Handle NaN and Unnamed columns
-                if pd.isna(name) or (isinstance(name, str) and name.startswith('Unnamed:')):
-                    # Use previous name at this level if available
-                    if prev_names[level_idx] is not None:
-                        name = prev_names[level_idx]
-                    else:
-                        name = None
-                else:
-                    prev_names[level_idx] = name
-
-                if name is not None:
-                    parts.append(str(name).strip())
+            names = values.iloc[source].astype(str).str.strip().to_numpy()
+            names[source < 0] = None
+            levels.append(names)
 
+        flattened = []
+        for parts in zip(*levels):
             # Remove duplicates (parent == child case)
-            unique_parts = []
-            for part in parts:
-                if not unique_parts or unique_parts[-1] != part:
-                    unique_parts.append(part)
+            unique_parts = [part for part, _ in itertools.groupby(p for p in parts if p is not None)]
 
             # Join with separator
             col_name = self.separator.join(unique_parts) if unique_parts else f"Column_{len(flattened)}"
@@ -393,28 +629,38 @@ class MultiLevelReader:
 
     def _clean_column_names(self, columns: pd.Index) -> list[str]:
         """Clean single-level column names."""
-        cleaned = []
+        names = pd.Series(columns, dtype=object)
+        missing = self._unnamed_mask(names)
 
-        for col in columns:
-            if pd.isna(col) or (isinstance(col, str) and col.startswith('Unnamed:')):
-                cleaned.append(f"Column_{len(cleaned)}")
-            else:
-                cleaned.append(str(col).strip())
+        cleaned = [
+            f"Column_{i}" if is_missing else name
+            for i, (is_missing, name) in enumerate(zip(missing, names.astype(str).str.strip()))
+        ]
 
         return self._handle_duplicate_names(cleaned)
 
+    def _unnamed_mask(self, names: pd.Series) -> np.ndarray:
+        """Mask the NaN and 'Unnamed: ...' (pandas placeholder) names of an object Series."""
+        # Not .str.startswith: the accessor rejects Series holding no strings
+        is_unnamed = np.fromiter(
+            (isinstance(v, str) and v.startswith('Unnamed:') for v in names), dtype=bool, count=len(names)
+        )
+        return names.isna().to_numpy(dtype=bool) | is_unnamed
+
     def _handle_duplicate_names(self, names: list[str]) -> list[str]:
         """Add suffixes to duplicate column names."""
+        # Most headers have no duplicates; check that in one C-level pass
+        if len(set(names)) == len(names):
+            return list(names)
+
         seen = {}
-        result = []
+        seen_get = seen.get
+        result = [None] * len(names)
 
-        for name in names:
-            if name in seen:
-                seen[name] += 1
-                result.append(f"{name}_{seen[name]}")
-            else:
-                seen[name] = 0
-                result.append(name)
+        for i, name in enumerate(names):
+            n = seen_get(name, -1) + 1
+            seen[name] = n
+            result[i] = name if n == 0 else f"{name}_{n}"
 
         return result
 
@@ -422,6 +668,7 @@ class MultiLevelReader:
         self,
         file_path: str | Path,
         sheet_name: str | int = 0,
+        **kwargs: Any,
     ) -> dict[str, Any]:
         """
         Analyze a file and return information about its header structure.
@@ -429,6 +676,7 @@ class MultiLevelReader:
         Args:
             file_path: Path to the file.
             sheet_name: Sheet name or index for Excel/ODS files.
+            **kwargs: Additional arguments for the pandas reader (e.g. encoding).
 
         Returns:
             Dictionary with header analysis information.
@@ -440,24 +688,64 @@ class MultiLevelReader:
         if format_type is None:
             return {'error': f'Unsupported format: {ext}'}
 
-        raw_df = self._read_raw(file_path, format_type, sheet_name)
-        detected_headers = self._detect_header_rows(raw_df)
+        if format_type == 'parquet' and _HAS_PYARROW and not kwargs:
+            # Column names and row count are in the footer; no row group is read.
+            # An empty table goes through the pandas metadata like a full read
+            import pyarrow.parquet as pq
 
+            parquet_file = pq.ParquetFile(file_path)
+            raw_df = parquet_file.schema_arrow.empty_table().to_pandas()
+            return self._build_header_info(
+                file_path, format_type, raw_df, [0], parquet_file.metadata.num_rows
+            )
+
+        # Header detection only looks at the first max_header_rows rows
+        raw_df = self._read_raw(file_path, format_type, sheet_name, sample=True, **kwargs)
+        if format_type == 'parquet':
+            detected_headers = [0]
+            total_rows = len(raw_df)
+        else:
+            detected_headers = self._detect_header_rows(raw_df)
+            # A full sample may have been cut short; the row count is unknown
+            total_rows = len(raw_df) if len(raw_df) < self.max_header_rows else None
+
+        return self._build_header_info(file_path, format_type, raw_df, detected_headers, total_rows)
+
+    def _build_header_info(
+        self,
+        file_path: Path,
+        format_type: str,
+        raw_df: pd.DataFrame,
+        detected_headers: list[int],
+        total_rows: int | None,
+    ) -> dict[str, Any]:
+        """
+        Summarize the header rows of an already-read raw DataFrame.
+        total_rows is the file's row count, or None if only a sample was read.
+        """
         # Get header content
         header_content = []
-        for idx in detected_headers:
-            if idx < len(raw_df):
-                row_data = raw_df.iloc[idx].tolist()
-                header_content.append({
-                    'row_index': idx,
-                    'values': row_data,
-                    'non_null_count': sum(1 for v in row_data if pd.notna(v)),
-                })
+        if format_type == 'parquet':
+            # The header is the stored column names
+            header_content.append({
+                'row_index': 0,
+                'values': raw_df.columns.tolist(),
+                'non_null_count': len(raw_df.columns),
+            })
+        else:
+            for idx in detected_headers:
+                if idx < len(raw_df):
+                    row_data = raw_df.iloc[idx].tolist()
+                    header_content.append({
+                        'row_index': idx,
+                        'values': row_data,
+                        'non_null_count': sum(1 for v in row_data if pd.notna(v)),
+                    })
 
         return {
             'file_path': str(file_path),
             'format': format_type,
-            'total_rows': len(raw_df),
+            'total_rows': total_rows,
             'total_columns': len(raw_df.columns),
             'detected_header_rows': detected_headers,
             'header_count': len(detected_headers),
@@ -465,6 +753,11 @@ class MultiLevelReader:
         }
 
 
+# Shared reader with the default settings, for the convenience functions
+# Shared only for get_header_info(), which leaves last_header_info untouched
+_DEFAULT_READER = MultiLevelReader()
+
+
 def read_multi_level(
     file_path: str | Path,
     separator: str = '_',
@@ -489,10 +782,58 @@ def read_multi_level(
         >>> df = read_multi_level('data.xlsx')
         >>> df = read_multi_level('data.csv', separator='/', header_rows=2)
     """
+    # A fresh reader per call, so its last_header_info describes this file only
     reader = MultiLevelReader(separator=separator)
     return reader.read(file_path, header_rows=header_rows, sheet_name=sheet_name, **kwargs)
 
 
+def _read_one(file_path: str, separator: str, kwargs: dict[str, Any]) -> pd.DataFrame:
+    """Read one file for read_many() with its own reader (module-level so it pickles)."""
+    return MultiLevelReader(separator=separator).read(file_path, **kwargs)
+
+
+def read_many(
+    paths: Iterable[str | Path],
+    separator: str = '_',
+    max_workers: int | None = None,
+    executor: Executor | None = None,
+    **kwargs: Any,
+) -> dict[str, pd.DataFrame]:
+    """
+    Read several files concurrently, each with multi-level header handling.
+
+    The default thread pool overlaps file I/O and the parts of parsing that
+    run outside the GIL. Spreadsheet engines build Python objects under the
+    GIL (openpyxl/odf entirely), so for many workbooks pass a
+    ProcessPoolExecutor instead.
+
+    Args:
+        paths: Paths of the files to read.
+        separator: Character(s) used to join multi-level header names.
+        max_workers: Size of the default thread pool (default: one thread
+            per file, at most os.cpu_count()).
+        executor: Executor to use instead of a new thread pool; it is not
+            shut down afterwards.
+        **kwargs: Additional arguments passed to MultiLevelReader.read().
+
+    Returns:
+        Dictionary mapping each path (as a string) to its DataFrame, in input order.
+
+    Example:
+        >>> frames = read_many(Path('data').glob('*.xlsx'))
+    """
+    paths = [str(path) for path in paths]
+    # One reader per file: read() sets last_header_info, which pool threads must not share
+    read = functools.partial(_read_one, separator=separator, kwargs=kwargs)
+
+    if executor is not None:
+        return dict(zip(paths, executor.map(read, paths)))
+
+    max_workers = max_workers or min(len(paths), os.cpu_count() or 1) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(paths, pool.map(read, paths)))
+
+
 def analyze_headers(
     file_path: str | Path,
     sheet_name: str | int = 0,
@@ -507,8 +848,7 @@ def analyze_headers(
     Returns:
         Dictionary with header analysis information.
     """
-    reader = MultiLevelReader()
-    return reader.get_header_info(file_path, sheet_name)
+    return _DEFAULT_READER.get_header_info(file_path, sheet_name)
 
 
 if __name__ == '__main__':